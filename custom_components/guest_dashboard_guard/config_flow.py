@@ -1,13 +1,18 @@
 """Config flow for Guest Dashboard Guard integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.components.frontend import DATA_PANELS
+from homeassistant.components.lovelace import DOMAIN as LOVELACE_DOMAIN
+from homeassistant.components.lovelace.const import LOVELACE_DATA
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
@@ -25,63 +30,176 @@ from .const import (
     DEFAULT_ACTION_MODE,
     DEFAULT_GUEST_DETECTION,
     DEFAULT_CHECK_INTERVAL,
+    MIN_CHECK_INTERVAL,
+    MAX_CHECK_INTERVAL,
 )
+from .helpers import dashboard_key, iter_lovelace_dashboards
 
 _LOGGER = logging.getLogger(__name__)
 
+# Kept outside hass.data[DOMAIN], which maps entry IDs to coordinators
+USERS_CACHE = f"{DOMAIN}_users_cache"
+USERS_CACHE_TTL = 5.0  # seconds
+
+_ACTION_CHOICES = {
+    ACTION_NOTIFY: "Notify Only",
+    ACTION_REVOKE: "Auto-revoke and Notify",
+}
+_GUEST_CHOICES = {
+    GUEST_NON_ADMIN: "Non-admin Users",
+    GUEST_SPECIFIC_USERS: "Specific Users",
+}
+_CHECK_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_CHECK_INTERVAL, max=MAX_CHECK_INTERVAL)
+)
+
+# Schema fields that do not depend on users, dashboards or existing config
+_STATIC_FIELDS = {
+    vol.Required(CONF_ACTION_MODE, default=DEFAULT_ACTION_MODE): vol.In(
+        _ACTION_CHOICES
+    ),
+    vol.Required(CONF_GUEST_DETECTION, default=DEFAULT_GUEST_DETECTION): vol.In(
+        _GUEST_CHOICES
+    ),
+}
+_CHECK_INTERVAL_FIELD = {
+    vol.Optional(
+        CONF_CHECK_INTERVAL, default=DEFAULT_CHECK_INTERVAL
+    ): _CHECK_INTERVAL_VALIDATOR,
+}
+
+# Labels used to mark frontend panel types in the ignore list
+_ADMIN_TOOLS = frozenset({"developer-tools", "profile"})
+_SPECIAL_LABELS = {"config": "Settings"}
+
+
+async def _cached_users(hass: HomeAssistant) -> dict[str, str]:
+    """Get non-system users, cached briefly to share between flow steps."""
+    cached = hass.data.get(USERS_CACHE)
+    if cached is not None and time.monotonic() - cached[0] < USERS_CACHE_TTL:
+        return cached[1]
+
+    users = {
+        user.id: user.name or user.id
+        for user in await hass.auth.async_get_users()
+        if not user.system_generated
+    }
+
+    hass.data[USERS_CACHE] = (time.monotonic(), users)
+    return users
+
+
+class _UserAndDashboardHelpers:
+    """User and dashboard lookups shared by the config and options flows."""
+
+    hass: HomeAssistant
+    _dashboard_cache: dict[str, str] | None
+
+    async def _get_users(self) -> dict[str, str]:
+        """Get mapping of user ID to display name from Home Assistant."""
+        users: dict[str, str] = {}
+        try:
+            users = await _cached_users(self.hass)
+        except Exception as e:
+            _LOGGER.error("Error getting users: %s", e)
+        return users
 
-class GuestDashboardGuardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
+    async def _get_all_dashboards_and_panels(self) -> dict[str, str]:
+        """Get all dashboards and panels for selection."""
+        if self._dashboard_cache is not None:
+            return self._dashboard_cache
+
+        dashboard_options = {}
+
+        # Get Lovelace dashboards
+        try:
+            lovelace_data = self.hass.data.get(LOVELACE_DATA) or self.hass.data.get(
+                LOVELACE_DOMAIN
+            )
+            if lovelace_data:
+                for url_path, _, title, _ in iter_lovelace_dashboards(lovelace_data):
+                    key = dashboard_key(url_path)
+                    dashboard_options[key] = f"{title or key} (Lovelace)"
+        except Exception as e:
+            _LOGGER.debug("Error getting Lovelace dashboards: %s", e)
+
+        # Get Frontend panels
+        try:
+            if DATA_PANELS in self.hass.data:
+                panels = self.hass.data[DATA_PANELS]
+
+                # Skip panels already added as Lovelace dashboards
+                skip = set(dashboard_options)
+
+                for panel_key, panel in panels.items():
+                    if dashboard_key(panel_key) in skip:
+                        continue
+
+                    title = panel.sidebar_title or panel_key
+                    component = panel.component_name or ""
+
+                    # Add all panels but mark their type
+                    if component.startswith("ha_addon_"):
+                        label = "Add-on"
+                    elif special := _SPECIAL_LABELS.get(panel_key):
+                        label = special
+                    elif panel_key in _ADMIN_TOOLS:
+                        label = "Admin Tool"
+                    else:
+                        label = "Panel"
+                    dashboard_options[panel_key] = f"{title} ({label})"
+        except Exception as e:
+            _LOGGER.debug("Error getting frontend panels: %s", e)
+
+        self._dashboard_cache = dashboard_options
+        return dashboard_options
+
+
+class GuestDashboardGuardConfigFlow(
+    _UserAndDashboardHelpers, config_entries.ConfigFlow, domain=DOMAIN
+):
     """Handle a config flow for Guest Dashboard Guard."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize config flow."""
+        self._dashboard_cache: dict[str, str] | None = None
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        if self._async_current_entries():
+            return self.async_abort(reason="single_instance_allowed")
+
         errors: dict[str, str] = {}
 
         if user_input is not None:
             await self.async_set_unique_id("guest_dashboard_guard")
             self._abort_if_unique_id_configured()
 
+            self._dashboard_cache = None
             return self.async_create_entry(
                 title="Guest Dashboard Guard",
                 data=user_input,
             )
 
-        # Get list of users for the dropdown
-        users = await self._get_users()
-        user_options = {user["id"]: user["name"] for user in users}
-
-        # Get all dashboards and panels for ignore list
-        dashboard_options = await self._get_all_dashboards_and_panels()
+        # Get users for the dropdown and all dashboards and panels for ignore list
+        user_options, dashboard_options = await asyncio.gather(
+            self._get_users(), self._get_all_dashboards_and_panels()
+        )
 
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_ACTION_MODE, default=DEFAULT_ACTION_MODE): vol.In(
-                    {
-                        ACTION_NOTIFY: "Notify Only",
-                        ACTION_REVOKE: "Auto-revoke and Notify",
-                    }
-                ),
-                vol.Required(
-                    CONF_GUEST_DETECTION, default=DEFAULT_GUEST_DETECTION
-                ): vol.In(
-                    {
-                        GUEST_NON_ADMIN: "Non-admin Users",
-                        GUEST_SPECIFIC_USERS: "Specific Users",
-                    }
-                ),
+                **_STATIC_FIELDS,
                 vol.Optional(CONF_GUEST_USERS, default=[]): cv.multi_select(
                     user_options
                 ),
                 vol.Optional(CONF_IGNORED_DASHBOARDS, default=[]): cv.multi_select(
                     dashboard_options
                 ),
-                vol.Optional(
-                    CONF_CHECK_INTERVAL, default=DEFAULT_CHECK_INTERVAL
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                **_CHECK_INTERVAL_FIELD,
             }
         )
 
@@ -99,83 +217,15 @@ class GuestDashboardGuardConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return GuestDashboardGuardOptionsFlow(config_entry)
 
-    async def _get_users(self) -> list[dict[str, str]]:
-        """Get list of users from Home Assistant."""
-        users = []
-        try:
-            await self.hass.async_add_executor_job(lambda: None)  # Ensure we have access
-            user_collection = await self.hass.auth.async_get_users()
-            for user in user_collection:
-                if not user.system_generated:
-                    users.append({"id": user.id, "name": user.name or user.id})
-        except Exception as e:
-            _LOGGER.error("Error getting users: %s", e)
-        return users
-
-    async def _get_all_dashboards_and_panels(self) -> dict[str, str]:
-        """Get all dashboards and panels for selection."""
-        from homeassistant.components.lovelace.const import LOVELACE_DATA
-        from homeassistant.components.lovelace import DOMAIN as LOVELACE_DOMAIN
-        from homeassistant.components.frontend import DATA_PANELS
-
-        dashboard_options = {}
-
-        # Get Lovelace dashboards
-        try:
-            if LOVELACE_DATA in self.hass.data:
-                lovelace_data = self.hass.data[LOVELACE_DATA]
-                if hasattr(lovelace_data, "dashboards"):
-                    for url_path, dash_config in lovelace_data.dashboards.items():
-                        config_data = getattr(dash_config, "config", None)
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        key = url_path if url_path != "lovelace" else "default"
-                        dashboard_options[key] = f"{title} (Lovelace)"
-            elif LOVELACE_DOMAIN in self.hass.data:
-                lovelace_data = self.hass.data[LOVELACE_DOMAIN]
-                if hasattr(lovelace_data, "dashboards"):
-                    for url_path, dash_config in lovelace_data.dashboards.items():
-                        config_data = getattr(dash_config, "config", None)
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        key = url_path if url_path != "lovelace" else "default"
-                        dashboard_options[key] = f"{title} (Lovelace)"
-        except Exception as e:
-            _LOGGER.debug("Error getting Lovelace dashboards: %s", e)
-
-        # Get Frontend panels
-        try:
-            if DATA_PANELS in self.hass.data:
-                panels = self.hass.data[DATA_PANELS]
-                for panel_key, panel in panels.items():
-                    # Skip if already added as Lovelace dashboard
-                    if panel_key in dashboard_options or (panel_key == "lovelace" and "default" in dashboard_options):
-                        continue
-
-                    panel_info = panel.to_response()
-                    title = panel_info.get("title", panel_key)
-                    component = panel_info.get("component_name", "")
-
-                    # Add all panels but mark their type
-                    if component.startswith("ha_addon_"):
-                        dashboard_options[panel_key] = f"{title} (Add-on)"
-                    elif panel_key == "config":
-                        dashboard_options[panel_key] = f"{title} (Settings)"
-                    elif panel_key in ["developer-tools", "profile"]:
-                        dashboard_options[panel_key] = f"{title} (Admin Tool)"
-                    else:
-                        dashboard_options[panel_key] = f"{title} (Panel)"
-        except Exception as e:
-            _LOGGER.debug("Error getting frontend panels: %s", e)
 
-        return dashboard_options
-
-
-class GuestDashboardGuardOptionsFlow(config_entries.OptionsFlow):
+class GuestDashboardGuardOptionsFlow(_UserAndDashboardHelpers, config_entries.OptionsFlow):
     """Handle options flow for Guest Dashboard Guard."""
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         super().__init__()
         self._config_entry = config_entry
+        self._dashboard_cache: dict[str, str] | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -188,23 +238,14 @@ class GuestDashboardGuardOptionsFlow(config_entries.OptionsFlow):
             self.hass.config_entries.async_update_entry(
                 self._config_entry, data=user_input
             )
+            self._dashboard_cache = None
             return self.async_create_entry(title="", data={})
 
-        # Get list of users for the dropdown
-        try:
-            users = await self._get_users()
-            user_options = {user["id"]: user["name"] for user in users}
-        except Exception as e:
-            _LOGGER.exception("Failed to get users: %s", e)
-            errors["base"] = "cannot_connect"
-            user_options = {}
-
-        # Get all dashboards and panels for ignore list
-        try:
-            dashboard_options = await self._get_all_dashboards_and_panels()
-        except Exception as e:
-            _LOGGER.exception("Failed to get dashboards: %s", e)
-            dashboard_options = {}
+        # Get users for the dropdown and all dashboards and panels for ignore list;
+        # both helpers log their own errors and fall back to an empty mapping
+        user_options, dashboard_options = await asyncio.gather(
+            self._get_users(), self._get_all_dashboards_and_panels()
+        )
 
         current_data = self._config_entry.data
 
@@ -213,23 +254,13 @@ class GuestDashboardGuardOptionsFlow(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_ACTION_MODE,
                     default=current_data.get(CONF_ACTION_MODE, DEFAULT_ACTION_MODE),
-                ): vol.In(
-                    {
-                        ACTION_NOTIFY: "Notify Only",
-                        ACTION_REVOKE: "Auto-revoke and Notify",
-                    }
-                ),
+                ): vol.In(_ACTION_CHOICES),
                 vol.Required(
                     CONF_GUEST_DETECTION,
                     default=current_data.get(
                         CONF_GUEST_DETECTION, DEFAULT_GUEST_DETECTION
                     ),
-                ): vol.In(
-                    {
-                        GUEST_NON_ADMIN: "Non-admin Users",
-                        GUEST_SPECIFIC_USERS: "Specific Users",
-                    }
-                ),
+                ): vol.In(_GUEST_CHOICES),
                 vol.Optional(
                     CONF_GUEST_USERS,
                     default=current_data.get(CONF_GUEST_USERS, []),
@@ -241,7 +272,7 @@ class GuestDashboardGuardOptionsFlow(config_entries.OptionsFlow):
                 vol.Optional(
                     CONF_CHECK_INTERVAL,
                     default=current_data.get(CONF_CHECK_INTERVAL, DEFAULT_CHECK_INTERVAL),
-                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                ): _CHECK_INTERVAL_VALIDATOR,
             }
         )
 
@@ -250,72 +281,3 @@ class GuestDashboardGuardOptionsFlow(config_entries.OptionsFlow):
             data_schema=options_schema,
             errors=errors,
         )
-
-    async def _get_users(self) -> list[dict[str, str]]:
-        """Get list of users from Home Assistant."""
-        users = []
-        try:
-            await self.hass.async_add_executor_job(lambda: None)  # Ensure we have access
-            user_collection = await self.hass.auth.async_get_users()
-            for user in user_collection:
-                if not user.system_generated:
-                    users.append({"id": user.id, "name": user.name or user.id})
-        except Exception as e:
-            _LOGGER.error("Error getting users: %s", e)
-        return users
-
-    async def _get_all_dashboards_and_panels(self) -> dict[str, str]:
-        """Get all dashboards and panels for selection."""
-        from homeassistant.components.lovelace.const import LOVELACE_DATA
-        from homeassistant.components.lovelace import DOMAIN as LOVELACE_DOMAIN
-        from homeassistant.components.frontend import DATA_PANELS
-
-        dashboard_options = {}
-
-        # Get Lovelace dashboards
-        try:
-            if LOVELACE_DATA in self.hass.data:
-                lovelace_data = self.hass.data[LOVELACE_DATA]
-                if hasattr(lovelace_data, "dashboards"):
-                    for url_path, dash_config in lovelace_data.dashboards.items():
-                        config_data = getattr(dash_config, "config", None)
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        key = url_path if url_path != "lovelace" else "default"
-                        dashboard_options[key] = f"{title} (Lovelace)"
-            elif LOVELACE_DOMAIN in self.hass.data:
-                lovelace_data = self.hass.data[LOVELACE_DOMAIN]
-                if hasattr(lovelace_data, "dashboards"):
-                    for url_path, dash_config in lovelace_data.dashboards.items():
-                        config_data = getattr(dash_config, "config", None)
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        key = url_path if url_path != "lovelace" else "default"
-                        dashboard_options[key] = f"{title} (Lovelace)"
-        except Exception as e:
-            _LOGGER.debug("Error getting Lovelace dashboards: %s", e)
-
-        # Get Frontend panels
-        try:
-            if DATA_PANELS in self.hass.data:
-                panels = self.hass.data[DATA_PANELS]
-                for panel_key, panel in panels.items():
-                    # Skip if already added as Lovelace dashboard
-                    if panel_key in dashboard_options or (panel_key == "lovelace" and "default" in dashboard_options):
-                        continue
-
-                    panel_info = panel.to_response()
-                    title = panel_info.get("title", panel_key)
-                    component = panel_info.get("component_name", "")
-
-                    # Add all panels but mark their type
-                    if component.startswith("ha_addon_"):
-                        dashboard_options[panel_key] = f"{title} (Add-on)"
-                    elif panel_key == "config":
-                        dashboard_options[panel_key] = f"{title} (Settings)"
-                    elif panel_key in ["developer-tools", "profile"]:
-                        dashboard_options[panel_key] = f"{title} (Admin Tool)"
-                    else:
-                        dashboard_options[panel_key] = f"{title} (Panel)"
-        except Exception as e:
-            _LOGGER.debug("Error getting frontend panels: %s", e)
-
-        return dashboard_options
@@ -2,6 +2,13 @@
 
 DOMAIN = "guest_dashboard_guard"
 
+# Storage for dashboards that have already been checked
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.tracked"
+
+# Sent after a successful poll that left the coordinator data unchanged
+SIGNAL_CHECKED = f"{DOMAIN}_checked"
+
 # Configuration options
 CONF_ACTION_MODE = "action_mode"
 CONF_GUEST_DETECTION = "guest_detection"
@@ -21,3 +28,7 @@ GUEST_SPECIFIC_USERS = "specific_users"
 DEFAULT_CHECK_INTERVAL = 60  # seconds
 DEFAULT_ACTION_MODE = ACTION_NOTIFY
 DEFAULT_GUEST_DETECTION = GUEST_NON_ADMIN
+
+# Limits
+MIN_CHECK_INTERVAL = 10  # seconds
+MAX_CHECK_INTERVAL = 3600  # seconds
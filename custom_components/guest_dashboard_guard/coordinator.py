@@ -1,19 +1,23 @@
 """DataUpdateCoordinator for Guest Dashboard Guard."""
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
 from typing import Any
 
+from homeassistant.auth import EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED
 from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.components.lovelace import (
     DOMAIN as LOVELACE_DOMAIN,
 )
-from homeassistant.components.lovelace.const import LOVELACE_DATA
-from homeassistant.components.frontend import DATA_PANELS
+from homeassistant.components.lovelace.const import EVENT_LOVELACE_UPDATED, LOVELACE_DATA
+from homeassistant.components.frontend import DATA_PANELS, EVENT_PANELS_UPDATED
 from homeassistant.util import dt as dt_util
 
 from .const import (
@@ -27,10 +31,77 @@ from .const import (
     GUEST_NON_ADMIN,
     GUEST_SPECIFIC_USERS,
     DEFAULT_CHECK_INTERVAL,
+    MIN_CHECK_INTERVAL,
+    MAX_CHECK_INTERVAL,
+    SIGNAL_CHECKED,
+    STORAGE_KEY,
+    STORAGE_VERSION,
 )
+from .helpers import dashboard_key, iter_lovelace_dashboards
 
 _LOGGER = logging.getLogger(__name__)
 
+# Notification endings, depending on the action mode and revoke outcome
+_REVOKE_SUCCEEDED = (
+    "\n\nAttempting to revoke guest access..."
+    "\n✓ Guest access has been revoked successfully."
+)
+_REVOKE_FAILED = (
+    "\n\nAttempting to revoke guest access..."
+    "\n✗ Failed to automatically revoke access. "
+    "Please review dashboard permissions manually."
+)
+_REVIEW_HINT = (
+    "\n\nPlease review the dashboard permissions in "
+    "Settings → Dashboards."
+)
+
+# Consecutive polls without new dashboards after which the interval doubles
+BACKOFF_POLLS = frozenset({4, 8, 16})
+
+# Poll interval used while Lovelace has not been loaded yet
+LOVELACE_WAIT_INTERVAL = timedelta(seconds=60)
+
+# Seconds to wait before writing tracked dashboards to storage
+TRACKED_SAVE_DELAY = 30
+
+
+def _check_interval(entry: ConfigEntry) -> timedelta:
+    """Return the configured check interval, never below the minimum."""
+    return timedelta(
+        seconds=max(
+            MIN_CHECK_INTERVAL,
+            int(entry.data.get(CONF_CHECK_INTERVAL, DEFAULT_CHECK_INTERVAL)),
+        )
+    )
+
+
+def _backoff_interval(interval: timedelta, quiet_polls: int) -> timedelta:
+    """Return the poll interval after a quiet poll, doubling at BACKOFF_POLLS."""
+    if quiet_polls in BACKOFF_POLLS:
+        return min(interval * 2, timedelta(seconds=MAX_CHECK_INTERVAL))
+    return interval
+
+
+@dataclass(slots=True, frozen=True)
+class Dashboard:
+    """A dashboard or frontend panel monitored for guest access."""
+
+    url_path: str | None
+    title: str | None
+    mode: str
+    type: str
+    require_admin: bool
+    component_name: str = ""
+    # Placeholder: where visibility lives in the dashboard config depends on
+    # the HA version; None means visible to all users by default
+    visibility: dict[str, Any] | None = None
+    key: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Normalize the dashboard key used for tracking and ignore lists."""
+        object.__setattr__(self, "key", dashboard_key(self.url_path))
+
 
 class DashboardGuardCoordinator(DataUpdateCoordinator):
     """Class to manage fetching dashboard data and checking guest access."""
@@ -39,112 +110,254 @@ class DashboardGuardCoordinator(DataUpdateCoordinator):
         """Initialize coordinator."""
         self.config_entry = entry
         self._tracked_dashboards: set[str] = set()
+        self._store: Store[list[str]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self._violations_detected: list[dict[str, Any]] = []
-
-        check_interval = entry.data.get(CONF_CHECK_INTERVAL, DEFAULT_CHECK_INTERVAL)
+        # Summary notification ids and the dashboards each one reports
+        self._notifications: dict[str, frozenset[str]] = {}
+        self._dash_cache_key: tuple[int, int, int, int] | None = None
+        self._dash_cache_value: list[Dashboard] = []
+        self._dash_scan_complete = True
+        # Kept out of the coordinator data so unchanged polls compare equal
+        self.last_check: datetime | None = None
+        self._guest_users_cache: frozenset[str] | None = None
+        self._ignored: frozenset[str] = frozenset(entry.data.get(CONF_IGNORED_DASHBOARDS, []))
+        self._base_interval = _check_interval(entry)
+        self._quiet_polls = 0
+        self._waiting_for_lovelace = False
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=check_interval),
+            update_interval=self._base_interval,
+            always_update=False,
+        )
+
+        for event_type in (EVENT_LOVELACE_UPDATED, EVENT_PANELS_UPDATED):
+            entry.async_on_unload(
+                hass.bus.async_listen(event_type, self._handle_dashboards_updated)
+            )
+        for event_type in (EVENT_USER_ADDED, EVENT_USER_REMOVED, EVENT_USER_UPDATED):
+            entry.async_on_unload(
+                hass.bus.async_listen(event_type, self._handle_users_updated)
+            )
+        entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
+
+    async def async_load_tracked(self) -> None:
+        """Restore the dashboards that were checked before the last restart."""
+        if (stored := await self._store.async_load()) is not None:
+            self._tracked_dashboards = set(stored)
+
+    async def async_save_tracked(self) -> None:
+        """Write tracked dashboards now, replacing any pending delayed save."""
+        await self._store.async_save(self._tracked_data())
+
+    @callback
+    def _tracked_data(self) -> list[str]:
+        """Return the tracked dashboards in storable form."""
+        return sorted(self._tracked_dashboards)
+
+    async def _async_entry_updated(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Refresh cached values derived from the config entry."""
+        self._ignored = frozenset(entry.data.get(CONF_IGNORED_DASHBOARDS, []))
+        self._base_interval = _check_interval(entry)
+        self._invalidate_guest_users()
+        self._reset_backoff()
+        await self.async_request_refresh()
+
+    @callback
+    def _handle_dashboards_updated(self, event: Event) -> None:
+        """Rescan dashboards right away when dashboards or panels change."""
+        self._invalidate_dashboards()
+        self._reset_backoff()
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_users_updated(self, event: Event) -> None:
+        """Recheck untracked dashboards right away when users change."""
+        self._invalidate_guest_users()
+        self._reset_backoff()
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _reset_backoff(self) -> None:
+        """Go back to polling at the configured check interval."""
+        self._quiet_polls = 0
+        self.update_interval = self._base_interval
+
+    @callback
+    def _invalidate_guest_users(self) -> None:
+        """Drop the cached guest users so the next poll recomputes them."""
+        self._guest_users_cache = None
+
+    @callback
+    def _invalidate_dashboards(self) -> None:
+        """Drop the cached dashboard list so the next poll rebuilds it."""
+        self._dash_cache_key = None
+
+    def _dashboards_cache_key(self) -> tuple[int, int, int, int]:
+        """Return a cheap key that changes when dashboards or panels change."""
+        lovelace_data = self.hass.data.get(LOVELACE_DATA) or self.hass.data.get(LOVELACE_DOMAIN)
+        lovelace_dashboards = getattr(lovelace_data, "dashboards", lovelace_data)
+        panels = self.hass.data.get(DATA_PANELS)
+        return (
+            id(lovelace_data),
+            len(lovelace_dashboards) if isinstance(lovelace_dashboards, dict) else 0,
+            id(panels),
+            len(panels) if panels is not None else 0,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Home Assistant."""
+        # Lovelace may not be loaded yet during startup; poll slowly until it is
+        if LOVELACE_DATA not in self.hass.data and LOVELACE_DOMAIN not in self.hass.data:
+            _LOGGER.debug("Lovelace not loaded yet, skipping dashboard check")
+            self._waiting_for_lovelace = True
+            self.update_interval = max(self._base_interval, LOVELACE_WAIT_INTERVAL)
+            return self.data or {
+                "dashboards_count": 0,
+                "guest_users_count": 0,
+                "violations": [],
+            }
+
+        if self._waiting_for_lovelace:
+            self._waiting_for_lovelace = False
+            self._reset_backoff()
+
         try:
             dashboards = await self._get_dashboards()
             guest_users = await self._get_guest_users()
 
             violations = []
-            new_dashboards = []
-
-            for dashboard in dashboards:
-                dashboard_key = dashboard["url_path"] or "default"
-
-                # Check if this is a new dashboard
-                if dashboard_key not in self._tracked_dashboards:
-                    new_dashboards.append(dashboard_key)
-                    self._tracked_dashboards.add(dashboard_key)
-
-                    # Check for guest access violations
-                    violation = await self._check_dashboard_access(
-                        dashboard, guest_users
-                    )
-                    if violation:
-                        violations.append(violation)
 
-            # Handle violations
-            if violations:
-                await self._handle_violations(violations)
+            # Forget removed dashboards so they are checked again if recreated.
+            # Panels from add-ons and custom integrations register during
+            # startup, so only prune once Home Assistant is running, and never
+            # from a scan that failed part way.
+            current_keys = {dashboard.key for dashboard in dashboards}
+            stale_keys: set[str] = set()
+            if self.hass.state is CoreState.running and self._dash_scan_complete:
+                stale_keys = self._tracked_dashboards - current_keys
+                self._tracked_dashboards -= stale_keys
+                self._dismiss_resolved(current_keys)
+
+            # Nothing to check when there are no guests or every dashboard has
+            # been seen before. Dashboards stay untracked while there are no
+            # guests so they are checked once guests exist.
+            new_keys = current_keys - self._tracked_dashboards
+            if guest_users and new_keys:
+                new = [d for d in dashboards if d.key in new_keys]
+                self._tracked_dashboards |= new_keys
+
+                # Check new dashboards for guest access violations; violations
+                # for dashboards visible to everyone share one guest tuple
+                all_guests = tuple(sorted(guest_users))
+                violations = [
+                    violation
+                    for d in new
+                    if (violation := self._check_dashboard_access(d, guest_users, all_guests))
+                ]
+
+                # Handle violations
+                if violations:
+                    await self._handle_violations(violations)
+
+            # Persist tracking changes so a restart does not re-check everything
+            if stale_keys or (guest_users and new_keys):
+                self._store.async_delay_save(self._tracked_data, TRACKED_SAVE_DELAY)
+
+            # Poll less often while there is nothing new to check
+            if guest_users and new_keys:
+                self._reset_backoff()
+            else:
+                self._quiet_polls += 1
+                self.update_interval = _backoff_interval(
+                    self.update_interval, self._quiet_polls
+                )
 
             self._violations_detected = violations
+            self.last_check = dt_util.utcnow()
 
-            return {
+            data = {
                 "dashboards_count": len(dashboards),
                 "guest_users_count": len(guest_users),
                 "violations": violations,
-                "last_check": dt_util.now(),
             }
+            # Unchanged data skips the listeners (always_update=False), so tell
+            # the sensor exposing last_check that this poll still ran
+            if data == self.data:
+                async_dispatcher_send(self.hass, SIGNAL_CHECKED)
+            return data
 
         except Exception as err:
             _LOGGER.exception("Error fetching dashboard data: %s", err)
             raise UpdateFailed(f"Error communicating with Home Assistant: {err}")
 
-    async def _get_dashboards(self) -> list[dict[str, Any]]:
-        """Get all dashboards from Home Assistant (Lovelace + Frontend Panels)."""
-        dashboards = []
+    async def _get_dashboards(self) -> list[Dashboard]:
+        """Get all monitored dashboards, excluding ignored ones."""
+        cache_key = self._dashboards_cache_key()
+        if cache_key != self._dash_cache_key:
+            self._dash_cache_value, self._dash_scan_complete = await self._scan_dashboards()
+            # Rescan next poll instead of caching a partial result
+            self._dash_cache_key = cache_key if self._dash_scan_complete else None
+
+        dashboards = self._dash_cache_value
+
+        # Filter out ignored dashboards based on user configuration
+        ignored = self._ignored
+        if ignored:
+            _LOGGER.debug("Ignoring configured dashboards: %s", ignored)
+            dashboards = [d for d in dashboards if d.key not in ignored]
+
+        # Always add at least the default dashboard if none found
+        if not dashboards:
+            _LOGGER.warning("No dashboards detected, adding default dashboard")
+            dashboards = [Dashboard(
+                url_path=None,
+                title="Home",
+                mode="storage",
+                type="lovelace",
+                require_admin=False,
+            )]
+
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("Detected %d dashboard(s): %s", len(dashboards), [d.title for d in dashboards])
+        return dashboards
+
+    async def _scan_dashboards(self) -> tuple[list[Dashboard], bool]:
+        """Scan Home Assistant for dashboards (Lovelace + Frontend Panels).
+
+        Returns the dashboards and whether both parts were scanned without errors.
+        """
+        complete = True
+        # Keyed by dashboard key; Lovelace dashboards win over panels with the
+        # same key, so the "lovelace" panel is skipped for the default dashboard
+        by_key: dict[str, Dashboard] = {}
 
         # Part 1: Get Lovelace dashboards (storage/YAML mode)
         try:
-            # Try the correct LOVELACE_DATA constant first
-            if LOVELACE_DATA in self.hass.data:
-                lovelace_data = self.hass.data[LOVELACE_DATA]
-                _LOGGER.debug("Found LOVELACE_DATA, type: %s", type(lovelace_data))
-
-                if hasattr(lovelace_data, "dashboards"):
-                    for url_path, dash_config in lovelace_data.dashboards.items():
-                        config_data = getattr(dash_config, "config", None)
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        require_admin = getattr(dash_config, "require_admin", False)
-                        dashboards.append({
-                            "url_path": url_path if url_path != "lovelace" else None,
-                            "title": title,
-                            "mode": getattr(dash_config, "mode", "storage") if hasattr(dash_config, "mode") else "storage",
-                            "type": "lovelace",
-                            "require_admin": require_admin,
-                        })
-            # Fallback to old LOVELACE_DOMAIN method for compatibility
-            elif LOVELACE_DOMAIN in self.hass.data:
-                lovelace_data = self.hass.data[LOVELACE_DOMAIN]
-                _LOGGER.debug("Found LOVELACE_DOMAIN (fallback), type: %s", type(lovelace_data))
-
-                if hasattr(lovelace_data, "dashboards"):
-                    for url_path, dash_config in lovelace_data.dashboards.items():
-                        config_data = getattr(dash_config, "config", None)
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        require_admin = getattr(dash_config, "require_admin", False)
-                        dashboards.append({
-                            "url_path": url_path if url_path != "lovelace" else None,
-                            "title": title,
-                            "mode": getattr(dash_config, "mode", "storage") if hasattr(dash_config, "mode") else "storage",
-                            "type": "lovelace",
-                            "require_admin": require_admin,
-                        })
-                elif isinstance(lovelace_data, dict):
-                    for url_path, dash_config in lovelace_data.items():
-                        config_data = getattr(dash_config, "config", None) if dash_config else None
-                        title = config_data.get("title", url_path) if config_data and isinstance(config_data, dict) else url_path
-                        require_admin = getattr(dash_config, "require_admin", False) if dash_config else False
-                        dashboards.append({
-                            "url_path": url_path if url_path != "lovelace" else None,
-                            "title": title,
-                            "mode": getattr(dash_config, "mode", "storage") if dash_config and hasattr(dash_config, "mode") else "storage",
-                            "type": "lovelace",
-                            "require_admin": require_admin,
-                        })
-        except Exception as e:
-            _LOGGER.exception("Error getting Lovelace dashboards: %s", e)
+            # Try the correct LOVELACE_DATA constant first, then fall back to the
+            # old LOVELACE_DOMAIN key for compatibility
+            lovelace_data = self.hass.data.get(LOVELACE_DATA) or self.hass.data.get(LOVELACE_DOMAIN)
+            if lovelace_data is not None:
+                _LOGGER.debug("Found Lovelace data, type: %s", type(lovelace_data))
+                for url_path, dash_config, title, config_data in iter_lovelace_dashboards(
+                    lovelace_data
+                ):
+                    # Lovelace runs first and its keys are unique, so plain
+                    # stores suffice
+                    dashboard = Dashboard(
+                        url_path=url_path if url_path != "lovelace" else None,
+                        title=title,
+                        mode=getattr(dash_config, "mode", "storage"),
+                        type="lovelace",
+                        require_admin=getattr(dash_config, "require_admin", False),
+                        visibility=config_data.get("visibility") if config_data else None,
+                    )
+                    by_key[dashboard.key] = dashboard
+        except (AttributeError, KeyError, TypeError) as e:
+            _LOGGER.debug("Error getting Lovelace dashboards: %s", e)
+            complete = False
 
         # Part 2: Get Frontend Panel dashboards (All panels, user can filter via config)
         try:
@@ -153,198 +366,158 @@ class DashboardGuardCoordinator(DataUpdateCoordinator):
                 _LOGGER.debug("Found DATA_PANELS with %d panels", len(panels))
 
                 for panel_key, panel in panels.items():
-                    panel_info = panel.to_response()
-                    component_name = panel_info.get("component_name", "")
-
                     # Avoid duplicates with Lovelace dashboards
-                    if not any(d.get("url_path") == panel_key for d in dashboards):
-                        dashboards.append({
-                            "url_path": panel_key,
-                            "title": panel_info.get("title", panel_key),
-                            "mode": "panel",
-                            "type": "frontend_panel",
-                            "component_name": component_name,
-                            "require_admin": panel_info.get("require_admin", False),
-                        })
-                        _LOGGER.debug("Added frontend panel: %s (%s, component: %s)", panel_key, panel_info.get("title"), component_name)
-        except Exception as e:
-            _LOGGER.exception("Error getting frontend panels: %s", e)
-
-        # Remove duplicates based on url_path (keep first occurrence)
-        seen_paths = set()
-        unique_dashboards = []
-        for dashboard in dashboards:
-            path_key = dashboard["url_path"]
-            if path_key not in seen_paths:
-                seen_paths.add(path_key)
-                unique_dashboards.append(dashboard)
-            else:
-                _LOGGER.debug("Skipping duplicate dashboard: %s (%s)", path_key, dashboard.get("title"))
+                    if dashboard_key(panel_key) in by_key:
+                        _LOGGER.debug("Skipping duplicate dashboard: %s", panel_key)
+                        continue
 
-        dashboards = unique_dashboards
+                    panel_info = panel.to_response()
+                    component_name = panel_info.get("component_name", "")
 
-        # Filter out ignored dashboards based on user configuration
-        ignored_dashboards = set(self.config_entry.data.get(CONF_IGNORED_DASHBOARDS, []))
-        if ignored_dashboards:
-            _LOGGER.debug("Ignoring configured dashboards: %s", ignored_dashboards)
-            filtered_dashboards = []
-            for dashboard in dashboards:
-                # Check both url_path and "default" key for None url_path
-                path_key = dashboard["url_path"] if dashboard["url_path"] is not None else "default"
-                if path_key not in ignored_dashboards:
-                    filtered_dashboards.append(dashboard)
-                else:
-                    _LOGGER.debug("Ignoring dashboard: %s (%s)", path_key, dashboard.get("title"))
-            dashboards = filtered_dashboards
+                    dashboard = Dashboard(
+                        url_path=panel_key,
+                        title=panel_info.get("title", panel_key),
+                        mode="panel",
+                        type="frontend_panel",
+                        require_admin=panel_info.get("require_admin", False),
+                        component_name=component_name,
+                    )
+                    by_key[dashboard.key] = dashboard
+                    _LOGGER.debug("Added frontend panel: %s (%s, component: %s)", panel_key, panel_info.get("title"), component_name)
+        except (AttributeError, KeyError, TypeError) as e:
+            _LOGGER.debug("Error getting frontend panels: %s", e)
+            complete = False
 
-        # Always add at least the default dashboard if none found
-        if not dashboards:
-            _LOGGER.warning("No dashboards detected, adding default dashboard")
-            dashboards.append({
-                "url_path": None,
-                "title": "Home",
-                "mode": "storage",
-                "type": "lovelace",
-                "require_admin": False,
-            })
-
-        _LOGGER.info("Detected %d dashboard(s): %s", len(dashboards), [d["title"] for d in dashboards])
-        return dashboards
+        return list(by_key.values()), complete
 
-    async def _get_guest_users(self) -> set[str]:
+    async def _get_guest_users(self) -> frozenset[str]:
         """Get list of guest user IDs based on configuration."""
+        if self._guest_users_cache is not None:
+            return self._guest_users_cache
+
         guest_detection = self.config_entry.data.get(
             CONF_GUEST_DETECTION, GUEST_NON_ADMIN
         )
 
-        guest_users = set()
+        guest_users: frozenset[str] = frozenset()
 
         if guest_detection == GUEST_NON_ADMIN:
             # Consider all non-admin users as guests
-            for user in await self.hass.auth.async_get_users():
-                if not user.system_generated and not user.is_admin:
-                    guest_users.add(user.id)
+            users = await self.hass.auth.async_get_users()
+            guest_users = frozenset(
+                user.id for user in users if not user.system_generated and not user.is_admin
+            )
 
         elif guest_detection == GUEST_SPECIFIC_USERS:
             # Use specific user list from config
-            guest_users = set(
-                self.config_entry.data.get(CONF_GUEST_USERS, [])
+            guest_users = frozenset(
+                self.config_entry.data.get(CONF_GUEST_USERS, ())
             )
 
+        self._guest_users_cache = guest_users
         return guest_users
 
-    async def _check_dashboard_access(
-        self, dashboard: dict[str, Any], guest_users: set[str]
+    def _check_dashboard_access(
+        self,
+        dashboard: Dashboard,
+        guest_users: frozenset[str],
+        all_guests: tuple[str, ...],
     ) -> dict[str, Any] | None:
         """Check if a dashboard has guest access enabled."""
         # In Home Assistant, if a dashboard doesn't have explicit visibility restrictions,
         # all users can see it by default. This is the violation we're checking for.
 
-        dashboard_key = dashboard["url_path"] or "default"
+        dashboard_key = dashboard.key
 
         # Dashboards/panels with require_admin are already protected
-        if dashboard.get("require_admin", False):
-            _LOGGER.debug("Dashboard %s (%s) requires admin, skipping check", dashboard_key, dashboard.get("title"))
+        if dashboard.require_admin:
+            _LOGGER.debug("Dashboard %s (%s) requires admin, skipping check", dashboard_key, dashboard.title)
             return None
 
-        # Try to get dashboard visibility settings
-        visibility = await self._get_dashboard_visibility(dashboard)
+        # Nobody to protect from this dashboard
+        if not guest_users:
+            return None
+
+        # Visibility settings captured while scanning dashboards
+        visibility = dashboard.visibility
 
         # If visibility is not restricted (None or empty), it's visible to all users
         if not visibility or visibility.get("visible_to_all", True):
             return {
                 "dashboard": dashboard_key,
-                "title": dashboard.get("title", dashboard_key),
+                "title": dashboard.title or dashboard_key,
                 "issue": "Dashboard is visible to all users by default",
-                "guest_users_affected": list(guest_users),
+                "guest_users_affected": all_guests,
             }
 
         # Check if any guest users are in the visible_users list
-        visible_users = visibility.get("visible_users", [])
-        affected_guests = guest_users.intersection(set(visible_users))
+        visible_users = visibility.get("visible_users", ())
 
-        if affected_guests:
+        if not guest_users.isdisjoint(visible_users):
+            affected_guests = guest_users.intersection(visible_users)
             return {
                 "dashboard": dashboard_key,
-                "title": dashboard.get("title", dashboard_key),
+                "title": dashboard.title or dashboard_key,
                 "issue": f"Guest users have explicit access: {len(affected_guests)} user(s)",
-                "guest_users_affected": list(affected_guests),
+                "guest_users_affected": tuple(sorted(affected_guests)),
             }
 
         return None
 
-    async def _get_dashboard_visibility(
-        self, dashboard: dict[str, Any]
-    ) -> dict[str, Any] | None:
-        """Get visibility settings for a dashboard."""
-        # This is a simplified implementation - actual implementation would need
-        # to access Home Assistant's internal dashboard configuration
-        # For now, we assume new dashboards are visible to all by default
-
-        url_path = dashboard["url_path"]
-
-        # Try to get the dashboard config
-        try:
-            lovelace = self.hass.data.get(LOVELACE_DOMAIN, {})
-            # Use attribute access instead of dict .get() to avoid deprecation warning
-            config_key = url_path or "lovelace"
-            config = getattr(lovelace, config_key, None) if hasattr(lovelace, config_key) else lovelace.get(config_key) if isinstance(lovelace, dict) else None
-
-            if config and hasattr(config, "config"):
-                views_config = config.config
-                # Check if there are visibility restrictions
-                # This is a placeholder - actual implementation depends on HA version
-                return views_config.get("visibility", {})
-
-        except Exception as e:
-            _LOGGER.debug("Could not get dashboard visibility: %s", e)
-
-        return None
-
     async def _handle_violations(self, violations: list[dict[str, Any]]) -> None:
         """Handle detected violations based on action mode."""
         action_mode = self.config_entry.data.get(CONF_ACTION_MODE)
+        messages = []
 
         for violation in violations:
             dashboard = violation["dashboard"]
             title = violation["title"]
             issue = violation["issue"]
 
+            if action_mode == ACTION_REVOKE:
+                # TODO: Implement auto-revoke functionality
+                # This requires modifying dashboard visibility settings
+                revoke_success = await self._revoke_guest_access(dashboard)
+                suffix = _REVOKE_SUCCEEDED if revoke_success else _REVOKE_FAILED
+            else:
+                suffix = _REVIEW_HINT
+
             # Always notify
             message = (
                 f"Dashboard '{title}' ({dashboard}) has a guest access issue:\n\n"
                 f"{issue}\n\n"
                 f"Guest users affected: {len(violation['guest_users_affected'])}"
+                f"{suffix}"
             )
 
-            if action_mode == ACTION_REVOKE:
-                # TODO: Implement auto-revoke functionality
-                # This requires modifying dashboard visibility settings
-                message += "\n\nAttempting to revoke guest access..."
-
-                revoke_success = await self._revoke_guest_access(dashboard)
+            messages.append(message)
 
-                if revoke_success:
-                    message += "\n✓ Guest access has been revoked successfully."
-                else:
-                    message += (
-                        "\n✗ Failed to automatically revoke access. "
-                        "Please review dashboard permissions manually."
-                    )
-            else:
-                message += (
-                    "\n\nPlease review the dashboard permissions in "
-                    "Settings → Dashboards."
-                )
+            _LOGGER.warning("Dashboard guest access violation detected: %s", violation)
 
-            persistent_notification.async_create(
-                self.hass,
-                message,
-                title="Guest Dashboard Guard Alert",
-                notification_id=f"{DOMAIN}_{dashboard}",
-            )
+        # One notification per update instead of one per dashboard. The id is
+        # derived from the batch's dashboards, so a later batch never replaces
+        # an unread one and the same batch can be updated or dismissed.
+        keys = sorted(violation["dashboard"] for violation in violations)
+        notification_id = f"{DOMAIN}_summary_{'_'.join(keys)}"
+        self._notifications[notification_id] = frozenset(keys)
+        persistent_notification.async_create(
+            self.hass,
+            "\n\n---\n\n".join(messages),
+            title=f"Guest Dashboard Guard: {len(messages)} violation(s)",
+            notification_id=notification_id,
+        )
 
-            _LOGGER.warning("Dashboard guest access violation detected: %s", violation)
+    @callback
+    def _dismiss_resolved(self, current_keys: set[str]) -> None:
+        """Dismiss summaries whose dashboards were all removed or ignored."""
+        resolved = [
+            notification_id
+            for notification_id, keys in self._notifications.items()
+            if keys.isdisjoint(current_keys)
+        ]
+        for notification_id in resolved:
+            persistent_notification.async_dismiss(self.hass, notification_id)
+            del self._notifications[notification_id]
 
     async def _revoke_guest_access(self, dashboard: str) -> bool:
         """Revoke guest access from a dashboard."""
@@ -355,7 +528,7 @@ class DashboardGuardCoordinator(DataUpdateCoordinator):
         # 3. Save the updated configuration
 
         # For now, we log that this would happen
-        _LOGGER.info(
+        _LOGGER.debug(
             "Would revoke guest access from dashboard: %s (not implemented yet)",
             dashboard,
         )
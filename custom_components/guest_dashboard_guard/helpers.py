@@ -0,0 +1,29 @@
+"""Dashboard helpers shared by the config flow and the coordinator."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+
+def dashboard_key(url_path: str | None) -> str:
+    """Return the key used for tracking and ignore lists for a url_path."""
+    return url_path if url_path not in (None, "", "lovelace") else "default"
+
+
+def iter_lovelace_dashboards(
+    lovelace_data: Any,
+) -> Iterator[tuple[str | None, Any, str | None, dict[str, Any] | None]]:
+    """Yield (url_path, dash_config, title, config) for each Lovelace dashboard.
+
+    Accepts both the LovelaceData layout with a ``dashboards`` attribute and a
+    plain dict of dashboards.
+    """
+    dashboards = getattr(lovelace_data, "dashboards", lovelace_data)
+    if not isinstance(dashboards, dict):
+        return
+
+    for url_path, dash_config in dashboards.items():
+        # Dashboard config is either a dict or None (default dashboard)
+        config_data = getattr(dash_config, "config", None) or None
+        title = config_data.get("title", url_path) if config_data else url_path
+        yield url_path, dash_config, title, config_data
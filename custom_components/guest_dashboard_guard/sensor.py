@@ -6,13 +6,22 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_CHECKED
 from .coordinator import DashboardGuardCoordinator
 
+# Shared by all sensors; they belong to the same device
+_DEVICE_INFO = {
+    "identifiers": {(DOMAIN, "guest_dashboard_guard")},
+    "name": "Guest Dashboard Guard",
+    "manufacturer": "Custom",
+    "model": "Dashboard Monitor",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -34,25 +43,34 @@ async def async_setup_entry(
 class DashboardGuardSensorBase(CoordinatorEntity, SensorEntity):
     """Base class for Guest Dashboard Guard sensors."""
 
+    _attr_device_info = _DEVICE_INFO
+    _data_key: str
+
     def __init__(self, coordinator: DashboardGuardCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._attr_has_entity_name = True
+        self._update_from_data()
 
-    @property
-    def device_info(self):
-        """Return device information about this entity."""
-        return {
-            "identifiers": {(DOMAIN, "guest_dashboard_guard")},
-            "name": "Guest Dashboard Guard",
-            "manufacturer": "Custom",
-            "model": "Dashboard Monitor",
-        }
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update cached state from the coordinator before writing it."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Read this sensor's value from the coordinator data."""
+        if self.coordinator.data:
+            self._attr_native_value = self.coordinator.data.get(self._data_key, 0)
+        else:
+            self._attr_native_value = None
 
 
 class DashboardCountSensor(DashboardGuardSensorBase):
     """Sensor showing the number of monitored dashboards."""
 
+    _data_key = "dashboards_count"
+
     def __init__(self, coordinator: DashboardGuardCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -61,17 +79,12 @@ class DashboardCountSensor(DashboardGuardSensorBase):
         self._attr_icon = "mdi:view-dashboard"
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("dashboards_count", 0)
-        return None
-
 
 class GuestUsersCountSensor(DashboardGuardSensorBase):
     """Sensor showing the number of guest users."""
 
+    _data_key = "guest_users_count"
+
     def __init__(self, coordinator: DashboardGuardCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -80,17 +93,12 @@ class GuestUsersCountSensor(DashboardGuardSensorBase):
         self._attr_icon = "mdi:account-group"
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the state of the sensor."""
-        if self.coordinator.data:
-            return self.coordinator.data.get("guest_users_count", 0)
-        return None
-
 
 class ViolationsSensor(DashboardGuardSensorBase):
     """Sensor showing detected violations."""
 
+    _data_key = "violations"
+
     def __init__(self, coordinator: DashboardGuardCoordinator) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
@@ -99,23 +107,24 @@ class ViolationsSensor(DashboardGuardSensorBase):
         self._attr_icon = "mdi:alert-circle"
         self._attr_state_class = SensorStateClass.MEASUREMENT
 
-    @property
-    def native_value(self) -> int:
-        """Return the state of the sensor."""
+    async def async_added_to_hass(self) -> None:
+        """Keep last_check current on polls that leave the data unchanged."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_CHECKED, self._handle_coordinator_update
+            )
+        )
+
+    def _update_from_data(self) -> None:
+        """Read the violation count and details from the coordinator data."""
         if self.coordinator.data:
-            violations = self.coordinator.data.get("violations", [])
-            return len(violations)
-        return 0
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes."""
-        if self.coordinator.data:
-            violations = self.coordinator.data.get("violations", [])
-            last_check = self.coordinator.data.get("last_check")
-
-            return {
+            violations = self.coordinator.data.get(self._data_key, [])
+            self._attr_native_value = len(violations)
+            self._attr_extra_state_attributes = {
                 "violations": violations,
-                "last_check": last_check,
+                "last_check": self.coordinator.last_check,
             }
-        return {}
+        else:
+            self._attr_native_value = 0
+            self._attr_extra_state_attributes = {}
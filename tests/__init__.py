@@ -0,0 +1 @@
+"""Tests for the Guest Dashboard Guard integration."""
@@ -0,0 +1,109 @@
+"""Tests for the Guest Dashboard Guard coordinator."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.lovelace.const import LOVELACE_DATA
+from homeassistant.core import CoreState, HomeAssistant
+
+from custom_components.guest_dashboard_guard.const import DOMAIN, MAX_CHECK_INTERVAL
+from custom_components.guest_dashboard_guard.coordinator import (
+    Dashboard,
+    DashboardGuardCoordinator,
+    _backoff_interval,
+)
+from custom_components.guest_dashboard_guard.helpers import dashboard_key
+
+
+def _dashboard(url_path: str | None) -> Dashboard:
+    """Build a Lovelace dashboard for tests."""
+    return Dashboard(
+        url_path=url_path,
+        title=url_path,
+        mode="storage",
+        type="lovelace",
+        require_admin=False,
+    )
+
+
+@pytest.mark.parametrize(
+    ("url_path", "expected"),
+    [
+        (None, "default"),
+        ("", "default"),
+        ("lovelace", "default"),
+        ("dashboard-guests", "dashboard-guests"),
+        ("hacs", "hacs"),
+    ],
+)
+def test_dashboard_key(url_path: str | None, expected: str) -> None:
+    """Default dashboard paths share one key; others keep their url_path."""
+    assert dashboard_key(url_path) == expected
+    assert _dashboard(url_path).key == expected
+
+
+def test_backoff_schedule() -> None:
+    """The interval doubles at quiet polls 4, 8 and 16 and then stays put."""
+    interval = timedelta(seconds=60)
+    intervals = {}
+    for quiet_polls in range(1, 21):
+        interval = _backoff_interval(interval, quiet_polls)
+        intervals[quiet_polls] = interval.total_seconds()
+
+    assert intervals[3] == 60
+    assert intervals[4] == 120
+    assert intervals[7] == 120
+    assert intervals[8] == 240
+    assert intervals[15] == 240
+    assert intervals[16] == 480
+    assert intervals[20] == 480
+
+
+def test_backoff_capped() -> None:
+    """Backoff never exceeds MAX_CHECK_INTERVAL."""
+    interval = timedelta(seconds=MAX_CHECK_INTERVAL - 100)
+    assert _backoff_interval(interval, 4) == timedelta(seconds=MAX_CHECK_INTERVAL)
+
+
+async def _coordinator(hass: HomeAssistant, tracked: set[str]) -> DashboardGuardCoordinator:
+    """Create a coordinator with restored tracked dashboards."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    hass.data[LOVELACE_DATA] = object()
+    coordinator = DashboardGuardCoordinator(hass, entry)
+    coordinator._tracked_dashboards = set(tracked)
+    return coordinator
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("state", "complete", "expected"),
+    [
+        (CoreState.starting, True, {"default", "hacs"}),
+        (CoreState.running, False, {"default", "hacs"}),
+        (CoreState.running, True, {"default"}),
+    ],
+)
+async def test_pruning_waits_for_running(
+    hass: HomeAssistant, state: CoreState, complete: bool, expected: set[str]
+) -> None:
+    """Missing dashboards are only pruned from a complete scan once running."""
+    coordinator = await _coordinator(hass, {"default", "hacs"})
+    coordinator._dash_scan_complete = complete
+    hass.set_state(state)
+
+    with (
+        patch.object(
+            coordinator, "_get_dashboards", AsyncMock(return_value=[_dashboard(None)])
+        ),
+        patch.object(
+            coordinator, "_get_guest_users", AsyncMock(return_value=frozenset())
+        ),
+    ):
+        await coordinator._async_update_data()
+
+    assert coordinator._tracked_dashboards == expected